@@ -1,10 +1,24 @@
 """Test Suite config."""
-import toml
+
+
+def _load_toml(path: str) -> dict:
+    """Parse a TOML file, preferring the stdlib parser when available."""
+    with open(path, encoding='utf-8') as toml_file:
+        text = toml_file.read()
+    # Imported here so runs without a config file never load a parser
+    try:
+        import tomllib
+    except ImportError:  # Python < 3.11
+        try:
+            import tomli as tomllib
+        except ImportError:
+            import toml as tomllib
+    return tomllib.loads(text)
 
 
 def load_config(config_file: str):
     """Load configuration from toml file."""
-    return toml.load(config_file)['config']
+    return _load_toml(config_file)['config']
 
 
 def default():
@@ -1,14 +1,32 @@
 """Default implementations."""
 
+import asyncio
+
 from protocol_tests.backchannel import (
     Backchannel, SubjectConnectionInfo
 )
 from protocol_tests.connection.backchannel import ConnectionsBackchannel
 
 
-def pause():
+async def prompt(message: str = '') -> str:
+    """
+    Read a line from the terminal without blocking the event loop.
+
+    The suite's HTTP endpoint shares the loop with the backchannel, so a
+    blocking input() would stall inbound messages while waiting on the user.
+    """
+    loop = asyncio.get_event_loop()
+    return await loop.run_in_executor(None, input, message)
+
+
+def _split_keys(value: str) -> [str]:
+    """Split comma-separated input into a list of non-empty keys."""
+    return [key for key in map(str.strip, value.split(',')) if key]
+
+
+async def pause():
     """Pause for input before continuing."""
-    input('Press ENTER to continue.')
+    await prompt('Press ENTER to continue.')
 
 
 class ManualBackchannel(Backchannel, ConnectionsBackchannel):
@@ -21,7 +39,7 @@ class ManualBackchannel(Backchannel, ConnectionsBackchannel):
 
     async def reset(self):
         print('Reset test subject to clean state.')
-        pause()
+        await pause()
 
     async def new_connection(self, info, parameters=None):
         print(
@@ -31,38 +49,34 @@ class ManualBackchannel(Backchannel, ConnectionsBackchannel):
         print('DID: {}\nVerkey: {}\nLabel: {}\nEndpoint: {}\n'.format(
             info.did, info.verkey, info.label, info.endpoint
         ))
-        did = input('Input connection DID generated by test subject: ')
-        recipients = input(
+        did = await prompt('Input connection DID generated by test subject: ')
+        recipients = await prompt(
             'Input recipients as comma-separated, base58-encoded values: '
         )
-        recipients = map(lambda recip: recip.strip(), recipients.split(','))
-        recipients = list(filter(lambda recip: recip, recipients))
-        routing_keys = input(
+        recipients = _split_keys(recipients)
+        routing_keys = await prompt(
             'Input routing keys as comma-separated, base58-encoded values'
             ' (hit ENTER for none): '
         )
-        routing_keys = map(
-            lambda recip: recip.strip(), routing_keys.split(',')
-        )
-        routing_keys = list(filter(lambda recip: recip, routing_keys))
-        endpoint = input('Input connection endpoint: ')
+        routing_keys = _split_keys(routing_keys)
+        endpoint = await prompt('Input connection endpoint: ')
 
         return SubjectConnectionInfo(did, recipients, routing_keys, endpoint)
 
     async def connections_v1_0_inviter_start(self) -> str:
         print('Generate a new invitation on test subject.')
-        return input('Enter invitation URL: ')
+        return await prompt('Enter invitation URL: ')
 
     async def connections_v1_0_invitee_start(self, invite):
         print('Paste the following invitation into the test subject.')
         print('Generated invitation: ', invite)
-        pause()
+        await pause()
 
     async def out_of_band_v1_0_create_invitation(self) -> str:
         print('Generate a new out of band invitation on test subject.')
-        return input('Enter invitation URL: ')
+        return await prompt('Enter invitation URL: ')
 
     async def out_of_band_v1_0_use_invitation(self, invite):
         print('Paste the following out of band invitation into the test subject.')
         print('Generated invitation: ', invite)
-        pause()
+        await pause()
@@ -1,4 +1,4 @@
-import json, aiohttp, base64, sys, hashlib, random, string
+import json, aiohttp, asyncio, base64, sys, hashlib, random, string, functools
 
 from datetime import datetime, date
 from protocol_tests.provider import Provider
@@ -8,6 +8,18 @@ from indy.error import IndyError, ErrorCode
 from hashlib import sha256
 
 
+async def _gather_all(*aws):
+    """
+    Run awaitables concurrently, letting every one finish before raising the
+    first failure so no sibling is left running unawaited.
+    """
+    results = await asyncio.gather(*aws, return_exceptions=True)
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+    return results
+
+
 class IndyProvider(Provider, IssueCredentialProvider):
     """
     The indy provider isolates all indy-specific code required by the test suite.
@@ -31,17 +43,34 @@ class IndyProvider(Provider, IssueCredentialProvider):
         self.cfg = json.dumps({'id': id})
         self.creds = json.dumps({'key': key})
         self.seed = json.dumps({'seed': seed})
+        # Schemas and cred defs are immutable on the ledger once written
+        self.schema_cache = {}
+        self.cred_def_cache = {}
+        # Fetched on first ledger write; {} when the ledger has no TAA
+        self.taa = None
+        # The wallet and the pool connection don't depend on each other
+        await _gather_all(self._setup_wallet(), self._setup_pool())
+
+    async def _setup_wallet(self):
+        # Try to create the wallet first; only delete and recreate it when a
+        # wallet from a previous run already exists
         try:
+            await wallet.create_wallet(self.cfg, self.creds)
+        except IndyError as e:
+            if e.error_code != ErrorCode.WalletAlreadyExistsError:
+                raise e
             await wallet.delete_wallet(self.cfg, self.creds)
-        except Exception as e:
-            pass
-        await wallet.create_wallet(self.cfg, self.creds)
+            await wallet.create_wallet(self.cfg, self.creds)
         self.wallet = await wallet.open_wallet(self.cfg, self.creds)
-        self.master_secret_id = await anoncreds.prover_create_master_secret(self.wallet, None)
-        (self.did, self.verkey) = await did.create_and_store_my_did(self.wallet, self.seed)
+        (self.master_secret_id, (self.did, self.verkey)) = await _gather_all(
+            anoncreds.prover_create_master_secret(self.wallet, None),
+            did.create_and_store_my_did(self.wallet, self.seed))
+
+    async def _setup_pool(self):
         # Download the genesis file
-        resp = await aiohttp.ClientSession().get(self.ledger_url)
-        genesis = await resp.read()
+        async with aiohttp.ClientSession() as session:
+            async with session.get(self.ledger_url) as resp:
+                genesis = await resp.read()
         genesisFileName = "genesis.apts"
         with open(genesisFileName, 'wb') as output:
             output.write(genesis)
@@ -67,9 +96,7 @@ class IndyProvider(Provider, IssueCredentialProvider):
         return schema_id
 
     async def issue_credential_v1_0_issuer_create_credential_definition(self, schema_id) -> str:
-        request = await ledger.build_get_schema_request(self.did, schema_id)
-        response = await ledger.submit_request(self.pool, request)
-        (_, schema) = await ledger.parse_get_schema_response(response)
+        (_, schema) = await self._get_schema(schema_id)
         (cred_def_id, cred_def_json) = await anoncreds.issuer_create_and_store_credential_def(
             self.wallet, self.did, schema, 'TAG1', 'CL', '{"support_revocation": false}')
         cred_def_request = await ledger.build_cred_def_request(self.did, cred_def_json)
@@ -232,17 +259,9 @@ class IndyProvider(Provider, IssueCredentialProvider):
             return json.dumps(predicate, indent=4, sort_keys=True)
 
     async def _verifier_get_entities_from_ledger(self, proof: dict) -> dict:
-        schemas = {}
-        cred_defs = {}
         revoc_reg_defs = {}
         revoc_regs = {}
-        for item in proof['identifiers']:
-            schemaID = item['schema_id']
-            (received_schema_id, received_schema) = await self._get_schema(schemaID)
-            schemas[received_schema_id] = json.loads(received_schema)
-            credDefID = item['cred_def_id']
-            (received_cred_def_id, received_cred_def) = await self._get_cred_def(credDefID)
-            cred_defs[received_cred_def_id] = json.loads(received_cred_def)
+        (schemas, cred_defs) = await self._get_schemas_and_cred_defs(proof['identifiers'])
         entities = {
             'schemas': schemas,
             'cred_defs': cred_defs,
@@ -252,25 +271,42 @@ class IndyProvider(Provider, IssueCredentialProvider):
         return entities
 
     async def _prover_get_entities_from_ledger(self, identifiers: dict) -> (str, str, str):
-        schemas = {}
-        cred_defs = {}
         rev_states = {}
-        for item in identifiers.values():
-            (received_schema_id, received_schema) = await self._get_schema(item['schema_id'])
+        (schemas, cred_defs) = await self._get_schemas_and_cred_defs(identifiers.values())
+        return json.dumps(schemas), json.dumps(cred_defs), json.dumps(rev_states)
+
+    async def _get_schemas_and_cred_defs(self, items) -> (dict, dict):
+        # The ledger lookups are independent of each other, so issue them all at once
+        schema_ids = list({item['schema_id'] for item in items})
+        cred_def_ids = list({item['cred_def_id'] for item in items})
+        results = await asyncio.gather(
+            *map(self._get_schema, schema_ids),
+            *map(self._get_cred_def, cred_def_ids)
+        )
+        schemas = {}
+        for (received_schema_id, received_schema) in results[:len(schema_ids)]:
             schemas[received_schema_id] = json.loads(received_schema)
-            (received_cred_def_id, received_cred_def) = await self._get_cred_def(item['cred_def_id'])
+        cred_defs = {}
+        for (received_cred_def_id, received_cred_def) in results[len(schema_ids):]:
             cred_defs[received_cred_def_id] = json.loads(received_cred_def)
-        return json.dumps(schemas), json.dumps(cred_defs), json.dumps(rev_states)
+        return schemas, cred_defs
 
     async def _get_schema(self, schema_id: str):
+        if schema_id in self.schema_cache:
+            return self.schema_cache[schema_id]
         get_schema_request = await ledger.build_get_schema_request(self.did, schema_id)
         get_schema_response = await ledger.submit_request(self.pool, get_schema_request)
-        return await ledger.parse_get_schema_response(get_schema_response)
+        schema = await ledger.parse_get_schema_response(get_schema_response)
+        self.schema_cache[schema_id] = schema
+        return schema
 
     async def _get_cred_def(self, credDefId):
+        if credDefId in self.cred_def_cache:
+            return self.cred_def_cache[credDefId]
         req = await ledger.build_get_cred_def_request(self.did, credDefId)
         resp = await ledger.submit_request(self.pool, req)
         credDef = await ledger.parse_get_cred_def_response(resp)
+        self.cred_def_cache[credDefId] = credDef
         return credDef
 
     async def _open_pool(self, cfg):
@@ -284,9 +320,11 @@ class IndyProvider(Provider, IssueCredentialProvider):
         self.pool = await pool.open_pool_ledger(self.pool_name, json.dumps(cfg))
 
     async def _append_taa(self, req):
-        getTaaReq = await ledger.build_get_txn_author_agreement_request(self.did, None)
-        response = await ledger.submit_request(self.pool, getTaaReq)
-        taa = (json.loads(response))["result"]["data"]
+        if self.taa is None:
+            getTaaReq = await ledger.build_get_txn_author_agreement_request(self.did, None)
+            response = await ledger.submit_request(self.pool, getTaaReq)
+            self.taa = (json.loads(response))["result"]["data"] or {}
+        taa = self.taa
         if not taa:
             return req
         curTime = int(datetime.combine(date.today(), datetime.min.time()).timestamp())
@@ -303,7 +341,11 @@ class IndyProvider(Provider, IssueCredentialProvider):
         return result
 
     # Adapted from https://github.com/hyperledger/aries-cloudagent-python/blob/0000f924a50b6ac5e6342bff90e64864672ee935/aries_cloudagent/messaging/util.py#L106
-    def _encode_attr(self, orig) -> str:
+    # The encoding is a pure function of the value; tests reuse the same few
+    # attribute values across many credentials, so results are memoized.
+    @staticmethod
+    @functools.lru_cache(maxsize=256, typed=True)
+    def _encode_attr(orig) -> str:
         """
         Encode a credential value as an int.
         Encode credential attribute value, purely stringifying any int32
@@ -1,23 +1,39 @@
 """ Protocol Test Helpers """
 from contextlib import contextmanager
-from typing import Dict, Iterable, Union
+from typing import Awaitable, Callable, Dict, Iterable, Union
+import asyncio
 import copy
+import functools
 import json
 import uuid
 
+import aiohttp
 from aries_staticagent import StaticConnection, Message, Module, crypto
-from voluptuous import Any
 from .backchannel import Backchannel
 from .provider import Provider
 from .schema import MessageSchema
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+
+@functools.lru_cache(maxsize=64)
+def _bytes_to_b58(key: bytes) -> str:
+    """
+    Base58 encode a key, memoized as the same connection keys are encoded
+    for every message received on them.
+    """
+    return crypto.bytes_to_b58(key)
+
 
 def _recipients_from_packed_message(packed_message: bytes) -> Iterable[str]:
     """
     Inspect the header of the packed message and extract the recipient key.
     """
     try:
-        wrapper = json.loads(packed_message)
+        wrapper = _json_loads(packed_message)
     except Exception as err:
         raise ValueError("Invalid packed message") from err
 
@@ -25,7 +41,7 @@ def _recipients_from_packed_message(packed_message: bytes) -> Iterable[str]:
         wrapper["protected"], urlsafe=True
     ).decode("ascii")
     try:
-        recips_outer = json.loads(recips_json)
+        recips_outer = _json_loads(recips_json)
     except Exception as err:
         raise ValueError("Invalid packed message recipients") from err
 
@@ -50,6 +66,7 @@ class Suite:
         self._backchannel = None
         self._provider = None
         self._reply = None
+        self._session = None
 
     @property
     def backchannel(self):
@@ -73,24 +90,78 @@ class Suite:
     def reply(self, handler):
         """Handle potential to reply."""
         self._reply = handler
-        yield
-        self._reply = None
+        try:
+            yield
+        finally:
+            self._reply = None
+
+    async def http_send(
+            self,
+            msg: bytes,
+            endpoint: str,
+            response_handler: Callable[[bytes], Awaitable[None]],
+            error_handler: Callable[[str], Awaitable[None]]):
+        """
+        Send over HTTP for frontchannels.
+
+        Unlike the default aries_staticagent sender, a single client session
+        is shared by all frontchannels so connections to the test subject are
+        kept alive and pooled rather than re-established on every message.
+        """
+        if not self._session:
+            self._session = aiohttp.ClientSession()
+        async with self._session.post(
+                endpoint,
+                data=msg,
+                headers={'content-type': 'application/ssi-agent-wire'}
+        ) as resp:
+            body = await resp.read()
+            if resp.status not in (200, 202):
+                await error_handler(
+                    'Error while sending message: {}'.format(resp.status)
+                )
+            if resp.status == 200 and body:
+                await response_handler(body)
+
+    async def close(self):
+        """Close the shared HTTP client session."""
+        if self._session:
+            await self._session.close()
+            self._session = None
 
     async def handle(self, packed_message: bytes):
         """
         Route an incoming message the appropriate frontchannels.
         """
         # TODO messages in plaintext cannot be routed
-        handled = False
-        for recipient in _recipients_from_packed_message(packed_message):
-            if recipient in self.frontchannels:
-                conn = self.frontchannels[recipient]
-                with conn.reply_handler(self._reply):
-                    await conn.handle(packed_message)
-                    handled = True
-        if not handled:
+        conns = [
+            self.frontchannels[recipient]
+            for recipient in _recipients_from_packed_message(packed_message)
+            if recipient in self.frontchannels
+        ]
+        if not conns:
             raise RuntimeError('Inbound message was not handled')
 
+        # Capture the reply handler now; another request may replace
+        # self._reply before any gathered task starts running.
+        reply = self._reply
+        if len(conns) == 1:
+            await self._handle_on(conns[0], reply, packed_message)
+            return
+
+        await asyncio.gather(*[
+            self._handle_on(conn, reply, packed_message) for conn in conns
+        ])
+
+    @staticmethod
+    async def _handle_on(
+            conn: StaticConnection,
+            reply: Callable,
+            packed_message: bytes):
+        """Handle a message on a single frontchannel."""
+        with conn.reply_handler(reply):
+            await conn.handle(packed_message)
+
     def new_frontchannel(
             self,
             *,
@@ -116,7 +187,8 @@ class Suite:
             their_vk=their_vk,
             endpoint=endpoint,
             recipients=recipients,
-            routing_keys=routing_keys
+            routing_keys=routing_keys,
+            send=self.http_send
         )
         frontchannel_index = crypto.bytes_to_b58(new_fc.verkey)
         self.frontchannels[frontchannel_index] = new_fc
@@ -135,8 +207,7 @@ class Suite:
             fc_vk: The frontchannel's verification key
         """
         frontchannel_index = crypto.bytes_to_b58(connection.verkey)
-        if frontchannel_index in self.frontchannels:
-            del self.frontchannels[frontchannel_index]
+        self.frontchannels.pop(frontchannel_index, None)
 
     @contextmanager
     def temporary_channel(
@@ -151,8 +222,10 @@ class Suite:
             their_vk=their_vk, endpoint=endpoint, recipients=recipients,
             routing_keys=routing_keys
         )
-        yield channel
-        self.remove_frontchannel(channel)
+        try:
+            yield channel
+        finally:
+            self.remove_frontchannel(channel)
 
 
 async def interrupt(generator, on: str = None):  # pylint: disable=invalid-name
@@ -267,14 +340,11 @@ class BaseHandler(Module):
     def assert_event(self, name):
         assert name in self.events
 
-    def verify_msg(self, typ, msg, conn, pid, schema, alt_pid=None):
+    def verify_msg(self, msg, conn, validator: MessageSchema):
         assert msg.mtc.is_authcrypted()
-        assert msg.mtc.sender == crypto.bytes_to_b58(conn.recipients[0])
-        assert msg.mtc.recipient == conn.verkey_b58
-        schema['@type'] = Any("{}/{}".format(pid, typ), "{}/{}".format(pid if not alt_pid else alt_pid, typ))
-        schema['@id'] = str
-        msg_schema = MessageSchema(schema)
-        msg_schema(msg)
+        assert msg.mtc.sender == _bytes_to_b58(conn.recipients[0])
+        assert msg.mtc.recipient == _bytes_to_b58(conn.verkey)
+        validator(msg)
         self._received_msg(msg, conn)
 
     async def send_async(self, msg, conn):
@@ -293,15 +363,12 @@ class BaseHandler(Module):
         senderOrder = 0
         receivedOrders = {}
         foundThid = False
-        if "~thread" in msg:
-            thread = msg["~thread"]
-            if "thid" in thread:
-                thid = thread["thid"]
-                foundThid = True
-            if "sender_order" in thread:
-                senderOrder = thread["sender_order"]
-            if "received_orders" in thread:
-                receivedOrders = thread["received_orders"]
+        thread = msg.get("~thread")
+        if thread:
+            foundThid = "thid" in thread
+            thid = thread.get("thid", thid)
+            senderOrder = thread.get("sender_order", senderOrder)
+            receivedOrders = thread.get("received_orders", receivedOrders)
         if self.thid:
             if not foundThid:
                 raise RuntimeError(
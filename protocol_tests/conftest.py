@@ -10,7 +10,6 @@ import asyncio
 import json
 import os
 from importlib import import_module
-from contextlib import suppress
 
 import pytest
 from aiohttp import web
@@ -18,16 +17,31 @@ from aiohttp import web
 from . import Suite
 from .backchannel import SuiteConnectionInfo
 
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 # pylint: disable=redefined-outer-name
 
 
+def _class_from_path(path: str):
+    """Import and return a class from a dotted path like 'module.Class'."""
+    mod_path, _, class_name = path.rpartition('.')
+    return getattr(import_module(mod_path), class_name)
+
+
 @pytest.fixture(scope='session')
 def event_loop():
     """ Create a session scoped event loop.
 
         pytest.asyncio plugin provides a default function scoped event loop
         which cannot be used as a dependency to session scoped fixtures.
+
+        The libuv based uvloop is used when it is installed.
     """
+    if uvloop:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
     return asyncio.get_event_loop()
 
 
@@ -64,22 +78,19 @@ async def http_endpoint(config, suite):
     runner = web.AppRunner(app)
     await runner.setup()
     site = web.TCPSite(runner, config['host'], config['port'])
-    server_task = asyncio.ensure_future(site.start())
+    # site.start() only binds the listening socket; serving is driven by
+    # the event loop, so no wrapper task is needed.
+    await site.start()
     yield
-    server_task.cancel()
-    with suppress(asyncio.CancelledError):
-        await server_task
-    await runner.cleanup()
+    await asyncio.gather(runner.cleanup(), suite.close())
 
 
 @pytest.fixture(scope='session')
 async def backchannel(config, http_endpoint, suite):
     """Get backchannel to test subject."""
-    if 'backchannel' in config and config['backchannel']:
-        path_parts = config['backchannel'].split('.')
-        mod_path, class_name = '.'.join(path_parts[:-1]), path_parts[-1]
-        mod = import_module(mod_path)
-        backchannel_class = getattr(mod, class_name)
+    backchannel_path = config.get('backchannel')
+    if backchannel_path:
+        backchannel_class = _class_from_path(backchannel_path)
     else:
         from default import ManualBackchannel
         backchannel_class = ManualBackchannel
@@ -93,12 +104,10 @@ async def backchannel(config, http_endpoint, suite):
 @pytest.fixture(scope='session')
 async def provider(config, suite):
     """Get provider to test subject."""
-    if not 'provider' in config and not config['provider']:
-        raise "No 'provider' was specified in the config file"
-    path_parts = config['provider'].split('.')
-    mod_path, class_name = '.'.join(path_parts[:-1]), path_parts[-1]
-    mod = import_module(mod_path)
-    provider_class = getattr(mod, class_name)
+    provider_path = config.get('provider')
+    if not provider_path:
+        raise RuntimeError("No 'provider' was specified in the config file")
+    provider_class = _class_from_path(provider_path)
     suite.set_provider(provider_class())
     await suite.provider.setup(config)
     yield suite.provider
@@ -1,7 +1,6 @@
 """Connection protocol messages and helpers."""
 
 import json
-import re
 import uuid
 import base64
 from collections import namedtuple
@@ -200,15 +199,14 @@ class Invite(Message):
     def parse_url(cls, invite: str):
         """Parse an invite url, returning a new message."""
 
-        try:
-            # If the invite is JSON already
-            json.loads(invite)
-        except ValueError:
+        # A JSON invite is passed straight to deserialize; peeking at the
+        # first character avoids parsing it twice.
+        if not invite.lstrip().startswith('{'):
             # If the invite is base64 url
-            matches = re.match('(.+)?c_i=(.+)', invite)
-            assert matches, 'Improperly formatted invite url!'
+            _, sep, b64_invite = invite.rpartition('c_i=')
+            assert sep and b64_invite, 'Improperly formatted invite url!'
             invite = crypto.b64_to_bytes(
-                matches.group(2), urlsafe=True
+                b64_invite, urlsafe=True
             ).decode('ascii')
 
         invite_msg = cls.deserialize(invite)
@@ -240,18 +238,25 @@ class HandshakeReuseHandler(BaseHandler):
     ALT_PID= "{}{}/{}".format(DOC_URI, PROTOCOL, VERSION)
     ROLES = ["sender", "receiver"]
 
+    REUSE_TYPE = "{}/handshake-reuse".format(PID)
+    REUSE_ACCEPTED_TYPE = "{}/handshake-reuse-accepted".format(PID)
+    REUSE_ACCEPTED_TYPES = (
+        REUSE_ACCEPTED_TYPE,
+        "{}/handshake-reuse-accepted".format(ALT_PID)
+    )
+
     def __init__(self, invite_id):
         super().__init__()
         self.invite_id = invite_id
 
-    @route("{}/handshake-reuse".format(PID))
+    @route(REUSE_TYPE)
     async def handle_handshake_reuse(self, msg, conn):
         """ Handle a handshake-reuse message and send the handshake-reuse-accepted message. """
         # Verify the message
         assert msg['~thread']['pthid'] == self.invite_id, 'The pthid of the reuse message should mirror the invitation ID'
 
         handshake_reuse_accepted = {
-            '@type': '{}/{}'.format(HandshakeReuseHandler.PID, 'handshake-reuse-accepted'),
+            '@type': HandshakeReuseHandler.REUSE_ACCEPTED_TYPE,
             '@id': str(uuid.uuid4()),
             "~thread": {
                 "thid": msg['@id'],
@@ -265,7 +270,7 @@ class HandshakeReuseHandler(BaseHandler):
         """ Send a handshake-reuse message and wait for the handshake-reuse-accepted message. """
         id = str(uuid.uuid4())
         handshake_reuse = {
-            "@type": '{}/{}'.format(HandshakeReuseHandler.PID, 'handshake-reuse'),
+            "@type": HandshakeReuseHandler.REUSE_TYPE,
             "@id": id,
             "~thread": {
                 "thid": id,
@@ -274,8 +279,7 @@ class HandshakeReuseHandler(BaseHandler):
         }
         handshake_reuse_accepted = await conn.send_and_await_reply_async(
             handshake_reuse,
-            condition=lambda msg: msg.type == ('{}/{}'.format(HandshakeReuseHandler.PID, 'handshake-reuse-accepted') 
-                                                or '{}/{}'.format(HandshakeReuseHandler.ALT_PID, 'handshake-reuse-accepted')),
+            condition=lambda msg: msg.type in HandshakeReuseHandler.REUSE_ACCEPTED_TYPES,
             timeout=10,
         )
 
@@ -371,15 +375,14 @@ class OutOfBandInvite(Message):
     def parse_url(cls, invite: str):
         """Parse an invite url, returning a new message."""
 
-        try:
-            # If the invite is JSON already
-            json.loads(invite)
-        except ValueError:
+        # A JSON invite is passed straight to deserialize; peeking at the
+        # first character avoids parsing it twice.
+        if not invite.lstrip().startswith('{'):
             # If the invite is base64 url
-            matches = re.match('(.+)?oob=(.+)', invite)
-            assert matches, 'Improperly formatted invite url!'
+            _, sep, b64_invite = invite.rpartition('oob=')
+            assert sep and b64_invite, 'Improperly formatted invite url!'
             invite = crypto.b64_to_bytes(
-                matches.group(2), urlsafe=True
+                b64_invite, urlsafe=True
             ).decode('ascii')
 
         invite_msg = cls.deserialize(invite)
@@ -414,6 +417,7 @@ class ConnectionRequest(Message):
 
     ALT_TYPE = Suite.ALT_TYPE_PREFIX + 'connections/1.0/request'
     TYPE = Suite.TYPE_PREFIX + 'connections/1.0/request'
+    TYPES = (TYPE, ALT_TYPE)
     VALIDATOR = MessageSchema({
         '@type': Any(TYPE, ALT_TYPE),
         '@id': str,
@@ -449,6 +453,7 @@ class ConnectionResponse(Message):
     """Connection response Message"""
     ALT_TYPE = Suite.ALT_TYPE_PREFIX + 'connections/1.0/response'
     TYPE = Suite.TYPE_PREFIX + 'connections/1.0/response'
+    TYPES = (TYPE, ALT_TYPE)
     PRE_SIG_VERIFY_VALIDATOR = MessageSchema({
         '@type': TYPE,
         '@id': str,
@@ -536,8 +541,7 @@ class ConnectionResponse(Message):
 class DidExchangeRequest(Message):
     ALT_TYPE = Suite.ALT_TYPE_PREFIX + 'didexchange/1.0/request'
     TYPE = Suite.TYPE_PREFIX + 'didexchange/1.0/request'
-
-    verified_did_doc = {}
+    TYPES = (TYPE, ALT_TYPE)
 
     VALIDATOR = MessageSchema({
         '@type': Any(TYPE, ALT_TYPE),
@@ -611,8 +615,7 @@ class DidExchangeResponse(Message):
     """Did exchange response Message"""
     ALT_TYPE = Suite.ALT_TYPE_PREFIX + 'didexchange/1.0/response'
     TYPE = Suite.TYPE_PREFIX + 'didexchange/1.0/response'
-
-    verified_did_doc = {}
+    TYPES = (TYPE, ALT_TYPE)
 
     VALIDATOR = MessageSchema({
         '@type': TYPE,
@@ -685,13 +688,14 @@ class DidExchangeResponse(Message):
         return resp
     
 
+# The algorithm for the protected object in the signature never changes, so
+# it is encoded once rather than on every signature.
+JWS_PROTECTED = base64.b64encode(json.dumps({"alg": "EdDSA"}).encode()).decode()
+
+
 def jws_sign(did_doc, public_verkey, private_sigkey):
     """ Creates a JWS signature object. """
 
-    # Encode the algorithm for the protected object in the signature.
-    protected_obj = json.dumps({"alg":"EdDSA"})
-    protected_str = base64.b64encode(protected_obj.encode()).decode()
-
     # Encode the DIDDoc for the base64 object in the signature.
     b64_did_doc = base64.b64encode(json.dumps(did_doc).encode()).decode()
 
@@ -709,7 +713,7 @@ def jws_sign(did_doc, public_verkey, private_sigkey):
         'base64': b64_did_doc,
         'jws': {
             'header': { 'kid': 'did:key:' + public_verkey },
-            'protected': protected_str,
+            'protected': JWS_PROTECTED,
             'signature': signature_str,
         }
     }
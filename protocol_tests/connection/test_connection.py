@@ -15,6 +15,11 @@ from aries_staticagent.mtc import (
 
 # pylint: disable=redefined-outer-name
 
+PING_RESPONSE_TYPES = (
+    Suite.TYPE_PREFIX + 'trust_ping/1.0/ping_response',
+    Suite.ALT_TYPE_PREFIX + 'trust_ping/1.0/ping_response'
+)
+
 # Inviter:
 
 async def _oob_receiver_flow(config, backchannel, temporary_channel):
@@ -60,7 +65,7 @@ async def _oob_receiver_flow(config, backchannel, temporary_channel):
             # Send out the DID exchange request, wait for the response and validate it
             response = DidExchangeResponse(await conn.send_and_await_reply_async(
                 request,
-                condition=lambda msg: msg.type == (DidExchangeResponse.TYPE or DidExchangeResponse.ALT_TYPE),
+                condition=lambda msg: msg.type in DidExchangeResponse.TYPES,
                 timeout=10
             ))
             response.validate()
@@ -103,7 +108,7 @@ async def _oob_receiver_flow(config, backchannel, temporary_channel):
 
             response = ConnectionResponse(await conn.send_and_await_reply_async(
                 request,
-                condition=lambda msg: msg.type == (ConnectionResponse.TYPE or ConnectionResponse.ALT_TYPE),
+                condition=lambda msg: msg.type in ConnectionResponse.TYPES,
                 timeout=30
             ))
 
@@ -174,7 +179,7 @@ async def _oob_sender_flow(config, backchannel, temporary_channel):
             msg = await wait_for(next_request, 30)
         
         # If the agent wants to preform a connection protocol
-        if msg['@type'] == (ConnectionRequest.TYPE or ConnectionRequest.ALT_TYPE):
+        if msg['@type'] in ConnectionRequest.TYPES:
 
             # Validate their connection request
             request = ConnectionRequest(msg)
@@ -205,7 +210,7 @@ async def _oob_sender_flow(config, backchannel, temporary_channel):
             await conn.send_async(response)
 
         # If the agent wants to do a did exchange
-        elif msg['@type'] == (DidExchangeRequest.TYPE or DidExchangeRequest.ALT_TYPE):
+        elif msg['@type'] in DidExchangeRequest.TYPES:
 
             # Validate their request
             request = DidExchangeRequest(msg)
@@ -292,7 +297,7 @@ async def _inviter(config, backchannel, temporary_channel):
 
         response = ConnectionResponse(await conn.send_and_await_reply_async(
             request,
-            condition=lambda msg: msg.type == (ConnectionResponse.TYPE or ConnectionResponse.ALT_TYPE),
+            condition=lambda msg: msg.type in ConnectionResponse.TYPES,
             timeout=30
         ))
 
@@ -368,8 +373,7 @@ async def test_finish_with_trust_ping(inviter):
             '@type': 'https://didcomm.org/trust_ping/1.0/ping',
             'response_requested': True
         },
-        condition=lambda msg: msg.type == (Suite.TYPE_PREFIX + 'trust_ping/1.0/ping_response' 
-                                                    or Suite.ALT_TYPE_PREFIX + 'trust_ping/1.0/ping_response'),
+        condition=lambda msg: msg.type in PING_RESPONSE_TYPES,
         timeout=5,
     )
 
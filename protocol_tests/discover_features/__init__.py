@@ -2,8 +2,9 @@ import re
 
 from aries_staticagent import Module, route, crypto
 from reporting import meta
-from voluptuous import Optional
+from voluptuous import Optional, Any
 from .. import BaseHandler
+from ..schema import MessageSchema
 
 
 class Handler(BaseHandler):
@@ -20,6 +21,13 @@ class Handler(BaseHandler):
     ALT_PID = "{}{}/{}".format(DOC_URI, PROTOCOL, VERSION)
     ROLES = ["requester", "responder"]
 
+    QUERY_VALIDATOR = MessageSchema({
+        '@type': Any('{}/query'.format(PID), '{}/query'.format(ALT_PID)),
+        '@id': str,
+        'query': str,
+        Optional('comment'): str,
+    })
+
     def __init__(self):
         super().__init__()
         self.query_message_count = 0
@@ -34,15 +42,13 @@ class Handler(BaseHandler):
     async def query(self, msg, conn):
         """Handle a discover-features query message. """
         # Verify the query message
-        self.verify_msg('query', msg, conn, Handler.PID, {
-            'query': str,
-            Optional('comment'): str,
-        }, alt_pid=Handler.ALT_PID)
-        query = msg['query']
+        self.verify_msg(msg, conn, Handler.QUERY_VALIDATOR)
+        # Compile the query once rather than per protocol
+        query = re.compile(msg['query'])
         # Find the protocols which match the query message
         matchingProtocols = []
         for proto in self.protocols:
-            if re.match(query, proto['pid']):
+            if query.match(proto['pid']):
                 matchingProtocols.append(proto)
         # Send the disclose message
         await self.send_async({
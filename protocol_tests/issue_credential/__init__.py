@@ -1,7 +1,8 @@
 from aries_staticagent import Module, Message, route, crypto
 from reporting import meta
-from voluptuous import Optional
+from voluptuous import Optional, Any
 from .. import BaseHandler
+from ..schema import MessageSchema
 
 
 class Handler(BaseHandler):
@@ -18,6 +19,72 @@ class Handler(BaseHandler):
     PID = "{}{}/{}".format(DOC_URI_HTTP, PROTOCOL, VERSION)
     ALT_PID = "{}{}/{}".format(DOC_URI, PROTOCOL, VERSION)
 
+    OFFER_CREDENTIAL_VALIDATOR = MessageSchema({
+        '@type': Any(
+            '{}/offer-credential'.format(PID),
+            '{}/offer-credential'.format(ALT_PID)
+        ),
+        '@id': str,
+        Optional('comment'): str,
+        'credential_preview': {
+            '@type': '{}/credential-preview'.format(PID),
+            'attributes': [
+                {
+                    "name": str,
+                    "mime-type": str,
+                    "value": str,
+                },
+            ],
+        },
+        'offers~attach': [
+            {
+                '@id': str,
+                'mime-type': str,
+                'data': {
+                    'base64': str
+                }
+            }
+        ]
+    })
+    REQUEST_CREDENTIAL_VALIDATOR = MessageSchema({
+        '@type': Any(
+            '{}/request-credential'.format(PID),
+            '{}/request-credential'.format(ALT_PID)
+        ),
+        '@id': str,
+        Optional('comment'): str,
+        'requests~attach': [
+            {
+                '@id': str,
+                'mime-type': str,
+                'data': {
+                    'base64': str
+                }
+            }
+        ]
+    })
+    ISSUE_CREDENTIAL_VALIDATOR = MessageSchema({
+        '@type': Any(
+            '{}/issue-credential'.format(PID),
+            '{}/issue-credential'.format(ALT_PID)
+        ),
+        '@id': str,
+        Optional('comment'): str,
+        'credentials~attach': [
+            {
+                '@id': str,
+                'mime-type': str,
+                'data': {
+                    'base64': str
+                }
+            }
+        ]
+    })
+    ACK_VALIDATOR = MessageSchema({
+        '@type': Any('{}/ack'.format(PID), '{}/ack'.format(ALT_PID)),
+        '@id': str,
+    })
+
     def __init__(self, provider):
         super().__init__()
         self.provider = provider
@@ -63,28 +130,7 @@ class Handler(BaseHandler):
     async def handle_offer_credential(self, msg, conn):
         """Handle an offer-credential message. """
         # Verify the format of the offer-credential message
-        self.verify_msg('offer-credential', msg, conn, Handler.PID, {
-            Optional('comment'): str,
-            'credential_preview': {
-                '@type': '{}/credential-preview'.format(Handler.PID),
-                'attributes': [
-                    {
-                        "name": str,
-                        "mime-type": str,
-                        "value": str,
-                    },
-                ],
-            },
-            'offers~attach': [
-                {
-                    '@id': str,
-                    'mime-type': str,
-                    'data': {
-                        'base64': str
-                    }
-                }
-            ]
-        }, alt_pid=Handler.ALT_PID)
+        self.verify_msg(msg, conn, Handler.OFFER_CREDENTIAL_VALIDATOR)
         offer_attach = msg['offers~attach'][0]['data']['base64']
         # Call the provider to create the credential request
         (request_attach, passback) = await self.provider.issue_credential_v1_0_holder_create_credential_request(offer_attach)
@@ -103,18 +149,7 @@ class Handler(BaseHandler):
             ]
         }
         reply = await self.send_and_await_reply_async(req, conn)
-        self.verify_msg('issue-credential', reply, conn, Handler.PID, {
-            Optional('comment'): str,
-            'credentials~attach': [
-                {
-                    '@id': str,
-                    'mime-type': str,
-                    'data': {
-                        'base64': str
-                    }
-                }
-            ]
-        }, alt_pid=Handler.ALT_PID)
+        self.verify_msg(reply, conn, Handler.ISSUE_CREDENTIAL_VALIDATOR)
         cred_attach = reply['credentials~attach'][0]['data']['base64']
         await self.provider.issue_credential_v1_0_holder_store_credential(cred_attach, passback)
         self.add_event("credential_stored")
@@ -123,18 +158,7 @@ class Handler(BaseHandler):
     async def handle_request_credential(self, msg, conn):
         """Handle a request-credential message. """
         # Verify the request-credential message
-        self.verify_msg('request-credential', msg, conn, Handler.PID, {
-            Optional('comment'): str,
-            'requests~attach': [
-                {
-                    '@id': str,
-                    'mime-type': str,
-                    'data': {
-                        'base64': str
-                    }
-                }
-            ]
-        }, alt_pid=Handler.ALT_PID)
+        self.verify_msg(msg, conn, Handler.REQUEST_CREDENTIAL_VALIDATOR)
         req_attach = msg['requests~attach'][0]['data']['base64']
         # Call the provider to create the credential
         cred_attach = await self.provider.issue_credential_v1_0_issuer_create_credential(self.offer, req_attach, self.attrs)
@@ -159,7 +183,7 @@ class Handler(BaseHandler):
     async def handle_ack(self, msg, conn):
         """Handle an ack message. """
         # Verify the ack message
-        self.verify_msg('ack', msg, conn, Handler.PID, {}, alt_pid=Handler.ALT_PID)
+        self.verify_msg(msg, conn, Handler.ACK_VALIDATOR)
         self.add_event("ack")
 
     def attrs_to_preview_attrs(self, attrs: dict) -> [dict]:
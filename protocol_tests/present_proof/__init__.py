@@ -3,7 +3,8 @@ import uuid
 from ..issue_credential import Handler as IssueCredentialHandler
 from aries_staticagent import Message, route, crypto
 from reporting import meta
-from voluptuous import Optional
+from voluptuous import Optional, Any
+from ..schema import MessageSchema
 
 
 class Handler(IssueCredentialHandler):
@@ -20,6 +21,41 @@ class Handler(IssueCredentialHandler):
     PID = "{}{}/{}".format(DOC_URI_HTTP, PROTOCOL, VERSION)
     ALT_PID = "{}{}/{}".format(DOC_URI, PROTOCOL, VERSION)
 
+    REQUEST_PRESENTATION_VALIDATOR = MessageSchema({
+        '@type': Any(
+            '{}/request-presentation'.format(PID),
+            '{}/request-presentation'.format(ALT_PID)
+        ),
+        '@id': str,
+        Optional('comment'): str,
+        'request_presentations~attach': [
+            {
+                '@id': str,
+                'mime-type': str,
+                'data': {
+                    'base64': str
+                }
+            }
+        ]
+    })
+    PRESENTATION_VALIDATOR = MessageSchema({
+        '@type': Any(
+            '{}/presentation'.format(PID),
+            '{}/presentation'.format(ALT_PID)
+        ),
+        '@id': str,
+        Optional('comment'): str,
+        'presentations~attach': [
+            {
+                '@id': str,
+                'mime-type': str,
+                'data': {
+                    'base64': str
+                }
+            }
+        ]
+    })
+
     def __init__(self, provider):
         super().__init__(provider)
 
@@ -64,18 +100,7 @@ class Handler(IssueCredentialHandler):
     async def handle_request_presentation(self, msg, conn):
         """Handle an request-presentation message. """
         # Verify the format of the request-presentation message
-        self.verify_msg('request-presentation', msg, conn, Handler.PID, {
-            Optional('comment'): str,
-            'request_presentations~attach': [
-                {
-                    '@id': str,
-                    'mime-type': str,
-                    'data': {
-                        'base64': str
-                    }
-                }
-            ]
-        }, alt_pid=Handler.ALT_PID)
+        self.verify_msg(msg, conn, Handler.REQUEST_PRESENTATION_VALIDATOR)
         req_attach = msg['request_presentations~attach'][0]['data']['base64']
         # Call the provider to create the credential request
         b64_proof = await self.provider.present_proof_v1_0_prover_create_presentation(req_attach)
@@ -98,18 +123,7 @@ class Handler(IssueCredentialHandler):
     async def handle_presentation(self, msg, conn):
         """Handle a presentation message. """
         # Verify the presentation message
-        self.verify_msg('presentation', msg, conn, Handler.PID, {
-            Optional('comment'): str,
-            'presentations~attach': [
-                {
-                    '@id': str,
-                    'mime-type': str,
-                    'data': {
-                        'base64': str
-                    }
-                }
-            ]
-        }, alt_pid=Handler.ALT_PID)
+        self.verify_msg(msg, conn, Handler.PRESENTATION_VALIDATOR)
         attach = msg['presentations~attach'][0]['data']['base64']
         # Call the provider to verify the proof
         attrs = await self.provider.present_proof_v1_0_verifier_verify_presentation(attach, self.proof_request)
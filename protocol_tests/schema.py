@@ -4,6 +4,8 @@ import logging
 from voluptuous import Schema, Optional, REMOVE_EXTRA, PREVENT_EXTRA
 from voluptuous.error import Invalid, MultipleInvalid
 
+LOGGER = logging.getLogger(__name__)
+
 
 class ValidationError(Exception):
     """When errors on validation."""
@@ -51,33 +53,39 @@ class MessageSchema():  # pylint: disable=too-few-public-methods
     If `Should` keys are found, the validated message is checked for missing
     `Should` keys and a warning is logged for each missing.
     """
-    __slots__ = ('schema', 'validator', 'extra')
+    __slots__ = ('schema', 'validator', 'extra', 'shoulds')
 
     def __init__(self, schema, allow_extra=True, default_required=False):
         self.schema = schema
         self.extra = REMOVE_EXTRA if allow_extra else PREVENT_EXTRA
         self.validator = Schema(schema, extra=self.extra, required=default_required)
+        self.shoulds = Should.find_in(schema)
 
 
     def __call__(self, msg):
-        logger = logging.getLogger(__name__)
         try:
             validated = self.validator(dict(msg))
+            # The remaining checks only produce warnings; skip the key
+            # walks entirely when there is nothing to check or no one
+            # listening.
+            if not LOGGER.isEnabledFor(logging.WARNING):
+                return validated
+            if self.extra != REMOVE_EXTRA and not self.shoulds:
+                return validated
+
             validated_key_set = _dict_key_set(validated)
             if self.extra == REMOVE_EXTRA:
                 removed = _dict_key_set(msg) - validated_key_set
                 if removed:
-                    logger.warning(
+                    LOGGER.warning(
                         'Unexpected message keys found: %s',
                         ', '.join(sorted(removed))
                     )
 
-
-            shoulds = Should.find_in(self.schema)
-            if shoulds:
-                missing_shoulds = shoulds - (validated_key_set & shoulds)
+            if self.shoulds:
+                missing_shoulds = self.shoulds - validated_key_set
                 if missing_shoulds:
-                    logger.warning(
+                    LOGGER.warning(
                         'SHOULD be present but are missing: %s',
                         ', '.join(sorted(missing_shoulds))
                     )
@@ -99,6 +107,8 @@ def is_valid(validator, value):
 
 class AtLeastOne():  # pylint: disable=too-few-public-methods
     """At least one item in a collection matches the given schema."""
+    __slots__ = ('validator', 'msg')
+
     def __init__(self, schema, msg=None):
         self.validator = Schema(schema)
         self.msg = msg
@@ -10,18 +10,18 @@ from aries_staticagent.mtc import (
 from reporting import meta
 from .schema import MessageSchema
 
+PONG_VALID = MessageSchema({
+    '@type': 'test/protocol/1.0/test',
+    '@id': str,
+    'msg': 'pong'
+})
+
 
 @pytest.mark.asyncio
 @meta(protocol='simple', version='0.1', role='*', name='simple')
 async def test_simple_messaging(connection):
     """Show simple messages being passed to and from the test subject."""
 
-    expected_schema = MessageSchema({
-        '@type': 'test/protocol/1.0/test',
-        '@id': str,
-        'msg': 'pong'
-    })
-
     ping = Message({
         '@type': 'test/protocol/1.0/test',
         'msg': 'ping'
@@ -38,4 +38,4 @@ async def test_simple_messaging(connection):
     assert pong.mtc.sender == crypto.bytes_to_b58(connection.recipients[0])
     assert pong.mtc.recipient == connection.verkey_b58
 
-    assert expected_schema(pong)
+    assert PONG_VALID(pong)
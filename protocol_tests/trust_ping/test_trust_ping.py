@@ -18,23 +18,36 @@ from .. import Suite
 TYPE = Suite.TYPE_PREFIX + "trust_ping/1.0/ping"
 ALT_TYPE = Suite.ALT_TYPE_PREFIX + "trust_ping/1.0/ping"
 
+TRUST_PONG_VALID = MessageSchema({
+    "@type": Any(TYPE, ALT_TYPE),
+    "@id": str,
+    "~thread": {"thid": str},
+    Optional("~timing"): {
+        Optional("in_time"): str,
+        Optional("out_time"): str
+    },
+    Optional("comment"): str
+})
+
+TRUST_PING_VALID = MessageSchema({
+    "@type": Any(TYPE, ALT_TYPE),
+    "@id": str,
+    Optional("~timing"): {
+        Optional("out_time"): str,
+        Optional("expires_time"): str,
+        Optional("delay_milli"): int
+    },
+    Optional("comment"): str,
+    "response_requested": bool
+})
+
+
 @pytest.mark.asyncio
 @meta(protocol='trust_ping', version='0.1',
       role='receiver', name='responds-to-trust-ping')
 async def test_trust_ping_with_response_requested_true(connection):
     """Test that subject responds to trust pings."""
 
-    expected_trust_pong_schema = MessageSchema({
-        "@type": Any(TYPE, ALT_TYPE),
-        "@id": str,
-        "~thread": {"thid": str},
-        Optional("~timing"): {
-            Optional("in_time"): str,
-            Optional("out_time"): str
-        },
-        Optional("comment"): str
-    })
-
     trust_ping = Message({
         "@type": TYPE,
         # "@id" is added by the staticagent lib
@@ -55,7 +68,7 @@ async def test_trust_ping_with_response_requested_true(connection):
     )
     assert trust_pong.mtc.recipient == connection.verkey_b58
 
-    assert expected_trust_pong_schema(trust_pong)
+    assert TRUST_PONG_VALID(trust_pong)
     assert trust_pong['~thread']['thid'] == trust_ping.id
 
 
@@ -64,23 +77,11 @@ async def test_trust_ping_with_response_requested_true(connection):
       role='sender', name='can-send-trust-ping')
 async def test_trust_ping_sender(backchannel, connection):
     """Test that subject sends a trust ping."""
-    expected_trust_ping_schema = MessageSchema({
-        "@type": Any(TYPE, ALT_TYPE),
-        "@id": str,
-        Optional("~timing"): {
-            Optional("out_time"): str,
-            Optional("expires_time"): str,
-            Optional("delay_milli"): int
-        },
-        Optional("comment"): str,
-        "response_requested": bool
-    })
-
     with connection.next() as next_msg:
         await backchannel.trust_ping_v1_0_send_ping(connection)
         msg = await asyncio.wait_for(next_msg, 5)
 
-    assert expected_trust_ping_schema(msg)
+    assert TRUST_PING_VALID(msg)
     assert msg.mtc.is_authcrypted()
     assert msg.mtc.sender == crypto.bytes_to_b58(connection.recipients[0])
     assert msg.mtc.recipient == connection.verkey_b58
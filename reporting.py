@@ -29,7 +29,9 @@ def meta(
 class TestFunction:
     """Container for TestFunction information."""
 
-    __slots__ = ('protocol', 'version', 'role', 'name', 'description')
+    __slots__ = (
+        'protocol', 'version', 'role', 'name', 'description', '_flat_name'
+    )
 
     def __init__(  # pylint: disable=too-many-arguments
             self,
@@ -43,6 +45,7 @@ class TestFunction:
         self.role = role
         self.name = name
         self.description = description
+        self._flat_name = None
 
     def flatten(self):
         """Flatten for serialization."""
@@ -56,8 +59,15 @@ class TestFunction:
         """
         Flattened name consisting of comma separated protocol, version, role,
         and name.
+
+        Computed on first access; hashing and reporting look this up
+        repeatedly for every collected test.
         """
-        return ','.join([self.protocol, self.version, self.role, self.name])
+        if self._flat_name is None:
+            self._flat_name = ','.join(
+                [self.protocol, self.version, self.role, self.name]
+            )
+        return self._flat_name
 
     def __hash__(self):
         return hash(self.flat_name)
@@ -77,13 +87,12 @@ class TestReport:
 
     def flatten(self):
         """Flatten this TestReport object into dictionary."""
-        return dict(filter(
-            lambda item: isinstance(item[1], bool) or bool(item[1]),
-            {
-                **self.function.flatten(),
-                'pass': self.passed,
-            }.items()
-        ))
+        flattened = self.function.flatten()
+        flattened['pass'] = self.passed
+        return {
+            key: value for key, value in flattened.items()
+            if isinstance(value, bool) or value
+        }
 
 
 class Report:
@@ -112,12 +121,11 @@ class Report:
 
     def add_notes(self, test_fn: TestFunction, note: Union[Sequence[str], str]):
         """Add developer notes for a test."""
-        if test_fn not in self.notes:
-            self.notes[test_fn.flat_name] = []
+        notes = self.notes.setdefault(test_fn.flat_name, [])
         if isinstance(note, str):
-            self.notes[test_fn.flat_name].append(note)
+            notes.append(note)
         else:
-            self.notes[test_fn.flat_name].extend(note)
+            notes.extend(note)
 
     def make_report(self) -> dict:
         """Construct flat report dictionary."""